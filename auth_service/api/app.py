@@ -4,6 +4,7 @@ from concurrent.futures.thread import ThreadPoolExecutor
 
 import uvloop
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from auth_service.log import app_logger, setup_logging
 from auth_service.settings import ServiceConfig
@@ -26,8 +27,7 @@ def setup_asyncio() -> None:
     loop.set_default_executor(executor)
 
     def handler(_, context: tp.Dict[str, tp.Any]) -> None:
-        message = "Caught asyncio exception: {message}".format_map(context)
-        app_logger.warning(message)
+        app_logger.warning("Caught asyncio exception: %s", context["message"])
 
     loop.set_exception_handler(handler)
 
@@ -36,7 +36,7 @@ def create_app(config: ServiceConfig) -> FastAPI:
     setup_logging(config)
     setup_asyncio()
 
-    app = FastAPI(debug=False)
+    app = FastAPI(debug=False, default_response_class=ORJSONResponse)
 
     app.state.security_service = make_security_service(config)
     app.state.mail_service = make_mail_service(config)
@@ -64,7 +64,7 @@ async def get_request_user(
         app_logger.info("Access token invalid")
         raise ForbiddenException()
 
-    app_logger.info(f"Request from user {user.user_id}")
+    app_logger.info("Request from user %s", user.user_id)
     return user
 
 
@@ -78,7 +78,7 @@ async def get_request_admin(
         raise NotFoundException()
 
     if user.role != UserRole.admin:
-        app_logger.info(f"User {user.user_id} is not admin")
+        app_logger.info("User %s is not admin", user.user_id)
         raise NotFoundException()
 
     return user
@@ -30,12 +30,12 @@ async def get_user(
     user_id: UUID,
     admin: User = Depends(get_request_admin),
 ) -> User:
-    app_logger.info(f"Admin {admin.user_id} asks for user {user_id}")
+    app_logger.info("Admin %s asks for user %s", admin.user_id, user_id)
     db_service = get_db_service(request.app)
     try:
         user = await db_service.get_user(user_id)
     except UserNotExists:
-        app_logger.info(f"Requested user {user_id} not found")
+        app_logger.info("Requested user %s not found", user_id)
         raise NotFoundException()
 
     return user
@@ -26,7 +26,7 @@ from auth_service.log import app_logger
 from auth_service.models.auth import TokenBody
 from auth_service.models.user import Newcomer, NewcomerFull, NewcomerRegistered
 from auth_service.response import create_response
-from auth_service.utils import utc_now
+from auth_service.utils import run_in_executor, utc_now
 
 router = APIRouter()
 
@@ -47,11 +47,16 @@ async def register(
     background_tasks: BackgroundTasks,
 ) -> Newcomer:
     app_logger.info(
-        f"Registration with email {newcomer.email} and name {newcomer.name}"
+        "Registration with email %s and name %s",
+        newcomer.email,
+        newcomer.name,
     )
 
     security_service = get_security_service(request.app)
-    if not security_service.is_password_proper(newcomer.password):
+    if not await run_in_executor(
+        security_service.is_password_proper,
+        newcomer.password,
+    ):
         app_logger.info("Password is improper")
         raise ImproperPasswordError()
 
@@ -59,7 +64,10 @@ async def register(
         name=newcomer.name,
         email=newcomer.email,
         marketing_agree=newcomer.marketing_agree,
-        hashed_password=security_service.hash_password(newcomer.password),
+        hashed_password=await run_in_executor(
+            security_service.hash_password,
+            newcomer.password,
+        ),
         user_id=uuid4(),
         created_at=utc_now(),
     )
@@ -71,19 +79,19 @@ async def register(
     try:
         created = await db_service.create_newcomer(newcomer_full, token)
     except UserAlreadyExists:
-        app_logger.info(f"User with email {newcomer.email} is already exists")
+        app_logger.info("User with email %s is already exists", newcomer.email)
         raise UserConflictException(
             error_key="email.already_exists",
             error_message="User with given email is already exists",
         )
     except TooManyNewcomersWithSameEmail:
-        app_logger.info(f"Too many newcomers with email {newcomer.email}")
+        app_logger.info("Too many newcomers with email %s", newcomer.email)
         raise UserConflictException()
     except TooManyChangeSameEmailRequests:
-        app_logger.info(f"Too many changes email {newcomer.email}")
+        app_logger.info("Too many changes email %s", newcomer.email)
         raise UserConflictException()
 
-    app_logger.info(f"Created newcomer {created.user_id}")
+    app_logger.info("Created newcomer %s", created.user_id)
 
     mail_service = get_mail_service(request.app)
     background_tasks.add_task(
@@ -124,5 +132,5 @@ async def verify_registered_user(
             error_message="User with this email already exists",
         )
 
-    app_logger.info(f"Verified user {user.user_id}")
+    app_logger.info("Verified user %s", user.user_id)
     return create_response(status_code=HTTPStatus.OK)
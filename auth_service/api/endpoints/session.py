@@ -19,6 +19,7 @@ from auth_service.log import app_logger
 from auth_service.models.auth import Credentials, TokenBody, TokenPair
 from auth_service.response import create_response
 from auth_service.security import SecurityService
+from auth_service.utils import run_in_executor
 
 router = APIRouter()
 
@@ -51,7 +52,7 @@ async def login(
     request: Request,
     credentials: Credentials,
 ) -> TokenPair:
-    app_logger.info(f"Login with email {credentials.email}")
+    app_logger.info("Login with email %s", credentials.email)
     db_service = get_db_service(request.app)
     security_service = get_security_service(request.app)
 
@@ -60,17 +61,18 @@ async def login(
             credentials.email
         )
     except UserNotExists:
-        app_logger.info(f"User with email {credentials.email} not exists")
+        app_logger.info("User with email %s not exists", credentials.email)
 
         try:
             hashed_nc_password = await db_service.get_newcomer_password(
                 credentials.email
             )
         except UserNotExists:
-            app_logger.info(f"Newcomer {credentials.email} not exists")
+            app_logger.info("Newcomer %s not exists", credentials.email)
             raise ForbiddenException(error_key="credentials.invalid")
 
-        if security_service.is_password_correct(
+        if await run_in_executor(
+            security_service.is_password_correct,
             credentials.password,
             hashed_nc_password,
         ):
@@ -80,16 +82,17 @@ async def login(
         app_logger.info("Newcomer exists, password invalid")
         raise ForbiddenException(error_key="credentials.invalid")
 
-    if not security_service.is_password_correct(
+    if not await run_in_executor(
+        security_service.is_password_correct,
         credentials.password,
         hashed_password,
     ):
-        app_logger.info(f"Password for user {user_id} invalid")
+        app_logger.info("Password for user %s invalid", user_id)
         raise ForbiddenException(error_key="credentials.invalid")
 
     session_id = await db_service.create_session(user_id)
     tokens = await _create_token_pair(security_service, db_service, session_id)
-    app_logger.info(f"Session {session_id} created for user {user_id}")
+    app_logger.info("Session %s created for user %s", session_id, user_id)
     return tokens
 
 
@@ -145,5 +148,5 @@ async def refresh_tokens(
         raise ForbiddenException()
 
     tokens = await _create_token_pair(security_service, db_service, session_id)
-    app_logger.info(f"Generated new token pair for session {session_id}")
+    app_logger.info("Generated new token pair for session %s", session_id)
     return tokens
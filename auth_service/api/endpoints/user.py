@@ -34,6 +34,7 @@ from auth_service.models.user import (
     UserInfo,
 )
 from auth_service.response import create_response
+from auth_service.utils import run_in_executor
 
 router = APIRouter()
 
@@ -50,7 +51,7 @@ router = APIRouter()
 def get_me(
     user: User = Depends(get_request_user),
 ) -> User:
-    app_logger.info(f"User {user.user_id} requested itself")
+    app_logger.info("User %s requested itself", user.user_id)
     return user
 
 
@@ -70,8 +71,10 @@ async def patch_me(
     user: User = Depends(get_request_user),
 ) -> User:
     app_logger.info(
-        f"User {user.user_id} with name {user.name} "
-        f"changes name to {new_user_info.name}"
+        "User %s with name %s changes name to %s",
+        user.user_id,
+        user.name,
+        new_user_info.name,
     )
     db_service = get_db_service(request.app)
     updated_user = await db_service.update_user(user.user_id, new_user_info)
@@ -92,21 +95,31 @@ async def patch_my_password(
     password_pair: ChangePasswordRequest,
     user: User = Depends(get_request_user),
 ) -> JSONResponse:
-    app_logger.info(f"User {user.user_id} changes password")
+    app_logger.info("User %s changes password", user.user_id)
     security_service = get_security_service(request.app)
-    if not security_service.is_password_proper(password_pair.new_password):
+    if not await run_in_executor(
+        security_service.is_password_proper,
+        password_pair.new_password,
+    ):
         app_logger.info("New password is improper")
         raise ImproperPasswordError()
 
+    async def is_old_password_valid(pass_hash: str) -> bool:
+        return await run_in_executor(
+            security_service.is_password_correct,
+            password_pair.password,
+            pass_hash,
+        )
+
     db_service = get_db_service(request.app)
     try:
         await db_service.update_password_if_old_is_valid(
             user.user_id,
-            security_service.hash_password(password_pair.new_password),
-            lambda pass_hash: security_service.is_password_correct(
-                password_pair.password,
-                pass_hash,
-            )
+            await run_in_executor(
+                security_service.hash_password,
+                password_pair.new_password,
+            ),
+            is_old_password_valid,
         )
     except PasswordInvalid:
         app_logger.info("Old password is invalid")
@@ -132,14 +145,20 @@ async def patch_my_email(
     user: User = Depends(get_request_user),
 ) -> JSONResponse:
     app_logger.info(
-        f"User {user.user_id} with email {user.email} "
-        f"changes email to {data.new_email}"
+        "User %s with email %s changes email to %s",
+        user.user_id,
+        user.email,
+        data.new_email,
     )
     db_service = get_db_service(request.app)
     security_service = get_security_service(request.app)
 
     _, hashed_pass = await db_service.get_user_with_password(user.email)
-    if not security_service.is_password_correct(data.password, hashed_pass):
+    if not await run_in_executor(
+        security_service.is_password_correct,
+        data.password,
+        hashed_pass,
+    ):
         app_logger.info("Password is invalid")
         raise ForbiddenException(error_key="password.invalid")
 
@@ -150,16 +169,16 @@ async def patch_my_email(
     try:
         await db_service.add_change_email_token(token)
     except UserAlreadyExists:
-        app_logger.info(f"User with email {data.new_email} is already exists")
+        app_logger.info("User with email %s is already exists", data.new_email)
         raise UserConflictException(
             error_key="email.already_exists",
             error_message="User with given email is already exists",
         )
     except TooManyNewcomersWithSameEmail:
-        app_logger.info(f"Too many newcomers with email {data.new_email}")
+        app_logger.info("Too many newcomers with email %s", data.new_email)
         raise UserConflictException()
     except TooManyChangeSameEmailRequests:
-        app_logger.info(f"Too many changes email {data.new_email}")
+        app_logger.info("Too many changes email %s", data.new_email)
         raise UserConflictException()
 
     mail_service = get_mail_service(request.app)
@@ -202,7 +221,11 @@ async def verify_email_change(
             error_message="User with this email is already exists",
         )
 
-    app_logger.info(f"Verified new email {user.email} for user {user.user_id}")
+    app_logger.info(
+        "Verified new email %s for user %s",
+        user.email,
+        user.user_id,
+    )
     return create_response(status_code=HTTPStatus.OK)
 
 
@@ -219,14 +242,14 @@ async def forgot_password(
     email_body: EmailBody,
     background_tasks: BackgroundTasks,
 ) -> JSONResponse:
-    app_logger.info(f"Forgot password request for email {email_body.email}")
+    app_logger.info("Forgot password request for email %s", email_body.email)
 
     response = create_response(status_code=HTTPStatus.ACCEPTED)
     db_service = get_db_service(request.app)
     try:
         user = await db_service.get_user_by_email(email_body.email)
     except UserNotExists:
-        app_logger.info(f"User with email {email_body.email} not exists")
+        app_logger.info("User with email %s not exists", email_body.email)
         return response
 
     security_service = get_security_service(request.app)
@@ -235,15 +258,17 @@ async def forgot_password(
     try:
         await db_service.create_password_token(token)
     except UserNotExists:
-        app_logger.info(f"User with email {email_body.email} not exists (2)")
+        app_logger.info("User with email %s not exists (2)", email_body.email)
     except TooManyPasswordTokens:
         app_logger.info(
-            f"Too many password tokens for user with email {email_body.email}"
+            "Too many password tokens for user with email %s",
+            email_body.email,
         )
         return response
 
     app_logger.info(
-        f"Created password token for user with email {email_body.email}"
+        "Created password token for user with email %s",
+        email_body.email,
     )
 
     mail_service = get_mail_service(request.app)
@@ -269,7 +294,10 @@ async def reset_password(
     verification: TokenPasswordBody,
 ) -> JSONResponse:
     security_service = get_security_service(request.app)
-    if not security_service.is_password_proper(verification.password):
+    if not await run_in_executor(
+        security_service.is_password_proper,
+        verification.password,
+    ):
         app_logger.info("Improper new password")
         raise ImproperPasswordError()
 
@@ -279,7 +307,10 @@ async def reset_password(
     try:
         await db_service.update_password_by_token(
             hashed_token,
-            security_service.hash_password(verification.password),
+            await run_in_executor(
+                security_service.hash_password,
+                verification.password,
+            ),
         )
     except TokenNotFound:
         app_logger.info("Token not found")
@@ -1,3 +1,4 @@
+import logging
 import typing as tp
 
 from fastapi import FastAPI, Request
@@ -15,15 +16,11 @@ from auth_service.response import create_response, server_error
 from .exceptions import AppException
 
 
-def exc_to_str(exc: Exception) -> str:
-    return f"{exc!r}"
-
-
 async def default_error_handler(
     request: Request,
     exc: Exception,
 ) -> JSONResponse:
-    app_logger.error(f"Default error handler caught: {exc_to_str(exc)}")
+    app_logger.error("Default error handler caught: %r", exc)
     error = Error(
         error_key="server_error",
         error_message=(
@@ -38,11 +35,8 @@ async def http_error_handler(
     request: Request,
     exc: HTTPException,
 ) -> JSONResponse:
-    log_msg = f"HTTP error: {exc_to_str(exc)}"
-    if exc.status_code >= 500:
-        app_logger.error(log_msg)
-    else:
-        app_logger.info(log_msg)
+    level = logging.ERROR if exc.status_code >= 500 else logging.INFO
+    app_logger.log(level, "HTTP error: %r", exc)
     error = Error(error_key="http_exception", error_message=exc.detail)
     return create_response(status_code=exc.status_code, errors=[error])
 
@@ -60,7 +54,7 @@ async def validation_error_handler(
         for err in exc.errors()
     ]
 
-    app_logger.info(f"Validation errors: {exc_to_str(exc)}")
+    app_logger.info("Validation errors: %r", exc)
     return create_response(status.HTTP_422_UNPROCESSABLE_ENTITY, errors=errors)
 
 
@@ -75,11 +69,8 @@ async def app_exception_handler(
             error_loc=exc.error_loc,
         )
     ]
-    log_msg = f"Application errors: {exc_to_str(exc)}"
-    if exc.status_code >= 500:
-        app_logger.error(log_msg)
-    else:
-        app_logger.info(log_msg)
+    level = logging.ERROR if exc.status_code >= 500 else logging.INFO
+    app_logger.log(level, "Application errors: %r", exc)
     return create_response(exc.status_code, errors=errors)
 
 
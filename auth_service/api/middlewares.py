@@ -78,10 +78,8 @@ class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
     ) -> Response:
         try:
             return await call_next(request)
-        except Exception as e:  # pylint: disable=W0703,W1203
-            app_logger.exception(
-                msg=f"Caught unhandled exception: {e!r}"
-            )
+        except Exception as e:  # pylint: disable=W0703
+            app_logger.exception("Caught unhandled exception: %r", e)
             error = Error(
                 error_key="server_error",
                 error_message=(
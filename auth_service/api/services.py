@@ -5,9 +5,14 @@ from fastapi import FastAPI
 
 from auth_service.db.service import DBService
 from auth_service.mail.service import MailService, SendgridMailService
-from auth_service.security import SecurityService
+from auth_service.security import (
+    SecurityService,
+    calibrate_password_hash_rounds,
+)
 from auth_service.settings import ServiceConfig
 
+DB_SERVER_SETTINGS = {"jit": "off", "timezone": "UTC"}
+
 
 def get_db_service(app: FastAPI) -> DBService:
     return app.state.db_service
@@ -25,7 +30,7 @@ def make_db_service(config: ServiceConfig) -> DBService:
     db_config = config.db_config.dict()
     pool_config = db_config.pop("db_pool_config")
     pool_config["dsn"] = pool_config.pop("db_url")
-    pool = create_pool(**pool_config)
+    pool = create_pool(**pool_config, server_settings=DB_SERVER_SETTINGS)
     service = DBService(pool=pool, **db_config)
     return service
 
@@ -42,6 +47,10 @@ def make_security_service(config: ServiceConfig) -> SecurityService:
         security_config[f"{token_type}_token_lifetime"] = timedelta(
             seconds=security_config.pop(f"{token_type}_token_lifetime_seconds")
         )
+    security_config["password_hash_rounds"] = calibrate_password_hash_rounds(
+        security_config["password_hash_rounds"],
+        security_config.pop("password_hash_time_target_seconds"),
+    )
     service = SecurityService(**security_config)
     return service
 
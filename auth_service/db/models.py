@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, orm
+from sqlalchemy import Column, ForeignKey, Index, orm
 from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.ext.declarative import DeclarativeMeta, declarative_base
 
@@ -97,14 +97,18 @@ class RefreshTokenTable(Base):
 
 class EmailTokenTable(Base):
     __tablename__ = "email_tokens"
+    __table_args__ = (
+        Index("ix_email_tokens_email_expired_at", "email", "expired_at"),
+    )
 
     token = Column(pg.VARCHAR(64), primary_key=True)
     user_id = Column(
         pg.UUID,
         ForeignKey(UserTable.user_id),
         nullable=False,
+        index=True,
     )
-    email = Column(pg.VARCHAR(128), index=True, nullable=False)
+    email = Column(pg.VARCHAR(128), nullable=False)
     created_at = Column(pg.TIMESTAMP, nullable=False)
     expired_at = Column(pg.TIMESTAMP, nullable=False)
 
@@ -113,6 +117,13 @@ class EmailTokenTable(Base):
 
 class PasswordTokenTable(Base):
     __tablename__ = "password_tokens"
+    __table_args__ = (
+        Index(
+            "ix_password_tokens_user_id_expired_at",
+            "user_id",
+            "expired_at",
+        ),
+    )
 
     token = Column(pg.VARCHAR(64), primary_key=True)
     user_id = Column(
@@ -180,7 +180,7 @@ class DBService(BaseModel):  # pylint: disable=too-many-public-methods
             newcomer.created_at,
             newcomer.marketing_agree,
         )
-        return Newcomer(**record)
+        return Newcomer.construct(**record)
 
     @staticmethod
     async def _add_registration_token(
@@ -260,7 +260,7 @@ class DBService(BaseModel):  # pylint: disable=too-many-public-methods
             UserRole.user,
             newcomer["marketing_agree"],
         )
-        return User(**record)
+        return User.construct(**record)
 
     @staticmethod
     async def _get_newcomer_by_token(
@@ -372,7 +372,7 @@ class DBService(BaseModel):  # pylint: disable=too-many-public-methods
         record = await self.pool.fetchrow(query, token, utc_now())
         if record is None:
             raise UserNotExists()
-        return User(**record)
+        return User.construct(**record)
 
     async def get_user(self, user_id: UUID) -> User:
         query = """
@@ -390,7 +390,7 @@ class DBService(BaseModel):  # pylint: disable=too-many-public-methods
         record = await self.pool.fetchrow(query, user_id)
         if record is None:
             raise UserNotExists()
-        return User(**record)
+        return User.construct(**record)
 
     async def finish_session(self, token: str) -> None:
         func = partial(self._finish_session, token=token)
@@ -471,13 +471,13 @@ class DBService(BaseModel):  # pylint: disable=too-many-public-methods
             user_info.marketing_agree,
             user_id,
         )
-        return User(**record)
+        return User.construct(**record)
 
     async def update_password_if_old_is_valid(
         self,
         user_id: UUID,
         new_password: str,
-        is_old_password_valid: tp.Callable[[str], bool],
+        is_old_password_valid: tp.Callable[[str], tp.Awaitable[bool]],
     ) -> None:
         func = partial(
             self._update_password_if_old_is_valid,
@@ -492,7 +492,7 @@ class DBService(BaseModel):  # pylint: disable=too-many-public-methods
         conn: Connection,
         user_id: UUID,
         new_password: str,
-        is_old_password_valid: tp.Callable[[str], bool],
+        is_old_password_valid: tp.Callable[[str], tp.Awaitable[bool]],
     ) -> None:
         get_query = """
             SELECT password
@@ -504,7 +504,7 @@ class DBService(BaseModel):  # pylint: disable=too-many-public-methods
         if password is None:
             raise UserNotExists()
 
-        if not is_old_password_valid(password):
+        if not await is_old_password_valid(password):
             raise PasswordInvalid()
 
         update_query = """
@@ -581,7 +581,7 @@ class DBService(BaseModel):  # pylint: disable=too-many-public-methods
                 , marketing_agree
         """
         record = await conn.fetchrow(query, record["email"], record["user_id"])
-        return User(**record)
+        return User.construct(**record)
 
     @staticmethod
     async def _drop_email_token(conn: Connection, token: str) -> None:
@@ -607,7 +607,7 @@ class DBService(BaseModel):  # pylint: disable=too-many-public-methods
         record = await self.pool.fetchrow(query, email)
         if record is None:
             raise UserNotExists()
-        return User(**record)
+        return User.construct(**record)
 
     async def create_password_token(self, token: PasswordToken) -> None:
         func = partial(self._create_password_token, token=token)
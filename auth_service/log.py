@@ -1,6 +1,10 @@
 import logging.config
+import sys
+import time
 import typing as tp
 
+import orjson
+
 from .context import REQUEST_ID
 from .settings import ServiceConfig
 
@@ -26,9 +30,8 @@ class ServiceNameFilter(logging.Filter):
         super().__init__(name)
 
     def filter(self, record: logging.LogRecord) -> bool:
-        setattr(record, "service_name", self.service_name)
-
-        return super().filter(record)
+        record.service_name = self.service_name
+        return True
 
 
 class RequestIDFilter(logging.Filter):
@@ -38,9 +41,53 @@ class RequestIDFilter(logging.Filter):
         super().__init__(name)
 
     def filter(self, record: logging.LogRecord) -> bool:
-        request_id = self.context_var.get("-")
-        setattr(record, "request_id", request_id)
-        return super().filter(record)
+        record.request_id = self.context_var.get("-")
+        return True
+
+
+class JSONAccessHandler(logging.Handler):
+
+    def __init__(
+        self,
+        stream: tp.Optional[tp.TextIO] = None,
+        datetime_format: str = logging.Formatter.default_time_format,
+    ) -> None:
+        self.stream = stream or sys.stdout
+        self.datetime_format = datetime_format
+
+        super().__init__()
+
+    def format_time(self, record: logging.LogRecord) -> str:
+        created = time.localtime(record.created)
+        return time.strftime(self.datetime_format, created)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = orjson.dumps(
+                {
+                    "time": self.format_time(record),
+                    "level": record.levelname,
+                    "service_name": getattr(record, "service_name", None),
+                    "logger": record.name,
+                    "pid": record.process,
+                    "request_id": getattr(record, "request_id", None),
+                    "method": getattr(record, "method", None),
+                    "requested_url": getattr(record, "requested_url", None),
+                    "status_code": getattr(record, "status_code", None),
+                    "request_time": getattr(record, "request_time", None),
+                },
+                default=str,
+                option=orjson.OPT_APPEND_NEWLINE,
+            )
+            buffer = getattr(self.stream, "buffer", None)
+            if buffer is None:
+                self.stream.write(line.decode())
+                self.stream.flush()
+            else:
+                buffer.write(line)
+                buffer.flush()
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
 
 
 def get_config(service_config: ServiceConfig) -> tp.Dict[str, tp.Any]:
@@ -103,9 +150,9 @@ def get_config(service_config: ServiceConfig) -> tp.Dict[str, tp.Any]:
                 "filters": ["service_name", "request_id"],
             },
             "access": {
-                "formatter": "access",
-                "class": "logging.StreamHandler",
+                "class": "auth_service.log.JSONAccessHandler",
                 "stream": "ext://sys.stdout",
+                "datetime_format": datetime_format,
                 "filters": ["service_name", "request_id"],
             },
             "gunicorn.access": {
@@ -128,21 +175,6 @@ def get_config(service_config: ServiceConfig) -> tp.Dict[str, tp.Any]:
                 ),
                 "datefmt": datetime_format,
             },
-            "access": {
-                "format": (
-                    'time="%(asctime)s" '
-                    'level="%(levelname)s" '
-                    'service_name="%(service_name)s" '
-                    'logger="%(name)s" '
-                    'pid="%(process)d" '
-                    'request_id="%(request_id)s" '
-                    'method="%(method)s" '
-                    'requested_url="%(requested_url)s" '
-                    'status_code="%(status_code)s" '
-                    'request_time="%(request_time)s" '
-                ),
-                "datefmt": datetime_format,
-            },
             "gunicorn.access": {
                 "format": (
                     'time="%(asctime)s" '
@@ -5,8 +5,9 @@ from pathlib import Path
 from socket import AF_INET
 
 import aiohttp
+import orjson
 from jinja2 import Environment, FileSystemLoader
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, HttpUrl, PrivateAttr
 
 from auth_service.models.token import TokenStr
 from auth_service.models.user import Newcomer, User
@@ -24,6 +25,7 @@ from .config import (
     RESET_PASSWORD_SENDER,
     RESET_PASSWORD_SUBJECT,
     RESET_PASSWORD_TEXT_TEMPLATE,
+    Sender,
 )
 
 TEMPLATES_PATH = Path(__file__).parent / "templates"
@@ -43,6 +45,25 @@ class MailService(BaseModel):
     change_email_link_template: str
     reset_password_link_template: str
 
+    _registration_from_email: str = PrivateAttr()
+    _change_email_from_email: str = PrivateAttr()
+    _reset_password_from_email: str = PrivateAttr()
+
+    def __init__(self, **data: tp.Any) -> None:
+        super().__init__(**data)
+        self._registration_from_email = self._make_from_email(
+            REGISTRATION_EMAIL_SENDER,
+        )
+        self._change_email_from_email = self._make_from_email(
+            CHANGE_EMAIL_SENDER,
+        )
+        self._reset_password_from_email = self._make_from_email(
+            RESET_PASSWORD_SENDER,
+        )
+
+    def _make_from_email(self, sender: Sender) -> str:
+        return f"{sender.username}@{self.mail_domain}"
+
     async def send_mail(
         self,
         from_email: str,
@@ -71,10 +92,9 @@ class MailService(BaseModel):
         }
         rendered = template.render(context)
         text = REGISTRATION_EMAIL_TEXT_TEMPLATE.format(link=link)
-        sender = REGISTRATION_EMAIL_SENDER
         await self.send_mail(
-            from_email=f"{sender.username}@{self.mail_domain}",
-            from_name=sender.name,
+            from_email=self._registration_from_email,
+            from_name=REGISTRATION_EMAIL_SENDER.name,
             to_email=newcomer.email,
             subject=REGISTRATION_EMAIL_SUBJECT,
             text=text,
@@ -99,10 +119,9 @@ class MailService(BaseModel):
         }
         rendered = template.render(context)
         text = CHANGE_EMAIL_TEXT_TEMPLATE.format(link=link)
-        sender = CHANGE_EMAIL_SENDER
         await self.send_mail(
-            from_email=f"{sender.username}@{self.mail_domain}",
-            from_name=sender.name,
+            from_email=self._change_email_from_email,
+            from_name=CHANGE_EMAIL_SENDER.name,
             to_email=new_email,
             subject=CHANGE_EMAIL_SUBJECT,
             text=text,
@@ -126,10 +145,9 @@ class MailService(BaseModel):
         }
         rendered = template.render(context)
         text = RESET_PASSWORD_TEXT_TEMPLATE.format(link=link)
-        sender = RESET_PASSWORD_SENDER
         await self.send_mail(
-            from_email=f"{sender.username}@{self.mail_domain}",
-            from_name=sender.name,
+            from_email=self._reset_password_from_email,
+            from_name=RESET_PASSWORD_SENDER.name,
             to_email=user.email,
             subject=RESET_PASSWORD_SUBJECT,
             text=text,
@@ -143,6 +161,15 @@ class SendgridMailService(MailService):
     aiohttp_pool_size: int
     aiohttp_session_timeout: float
 
+    _headers: tp.Dict[str, str] = PrivateAttr()
+
+    def __init__(self, **data: tp.Any) -> None:
+        super().__init__(**data)
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.sendgrid_api_key}",
+        }
+
     def _get_session(self) -> aiohttp.ClientSession:
         return aiohttp.ClientSession(
             timeout=aiohttp.ClientTimeout(total=self.aiohttp_session_timeout),
@@ -169,28 +196,28 @@ class SendgridMailService(MailService):
         text: str,
         html: str,
     ) -> None:
+        body = orjson.dumps(
+            {
+                "personalizations": [{"to": [{"email": to_email}]}],
+                "from": {"email": from_email, "name": from_name},
+                "subject": subject,
+                "content": [
+                    {
+                        "type": "text/plain",
+                        "value": text,
+                    },
+                    {
+                        "type": "text/html",
+                        "value": html,
+                    },
+                ],
+            }
+        )
         async with self._open_session() as session:
             async with session.post(
                 url=self.sendgrid_url,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.sendgrid_api_key}",
-                },
-                json={
-                    "personalizations": [{"to": [{"email": to_email}]}],
-                    "from": {"email": from_email, "name": from_name},
-                    "subject": subject,
-                    "content": [
-                        {
-                            "type": "text/plain",
-                            "value": text,
-                        },
-                        {
-                            "type": "text/html",
-                            "value": html,
-                        },
-                    ],
-                }
+                headers=self._headers,
+                data=body,
             ) as resp:
                 if resp.status != HTTPStatus.ACCEPTED:
                     resp_text = await resp.text()
@@ -1,7 +1,16 @@
+import re
 import typing as tp
 
 from pydantic import BaseModel
-from pydantic.networks import EmailStr
+from pydantic.errors import EmailError
+from pydantic.validators import str_validator
+
+EMAIL_PATTERN = re.compile(
+    r"(?=[^@]{1,64}@)"
+    r"[^\s@.<>,;:\"()\[\]\\]+(\.[^\s@.<>,;:\"()\[\]\\]+)*"
+    r"@([^\W_]([\w-]*[^\W_])?\.)+(?!\d+$)[^\W_]([\w-]*[^\W_])?"
+)
+MAX_EMAIL_LENGTH = 128
 
 
 class Error(BaseModel):
@@ -14,11 +23,23 @@ class ErrorResponse(BaseModel):
     errors: tp.List[Error]
 
 
-class Email(EmailStr):
+class Email(str):
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: tp.Dict[str, tp.Any]) -> None:
+        field_schema.update(type="string", format="email")
+
+    @classmethod
+    def __get_validators__(cls) -> tp.Iterator[tp.Callable[..., tp.Any]]:
+        yield str_validator
+        yield cls.validate
 
     @classmethod
     def validate(cls, value: str) -> str:
-        prepared = super().validate(value).strip().lower()
-        if len(prepared) > 128:
-            raise ValueError("Email length must be less or equal to 128")
+        prepared = value.strip().lower()
+        if (
+            len(prepared) > MAX_EMAIL_LENGTH
+            or not EMAIL_PATTERN.fullmatch(prepared)
+        ):
+            raise EmailError()
         return prepared
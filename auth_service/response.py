@@ -1,4 +1,3 @@
-import json
 import typing as tp
 from http import HTTPStatus
 
@@ -9,29 +8,17 @@ from pydantic import BaseModel
 from .models.common import Error
 
 
-class EnhancedJSONEncoder(json.JSONEncoder):
-    def default(self, o: tp.Any) -> tp.Any:
-        if isinstance(o, BaseModel):
-            return o.dict()
-        try:
-            orjson.dumps(o)
-        except TypeError:
-            return str(o)
-        return super().default(o)
+def orjson_default(o: tp.Any) -> tp.Any:
+    if isinstance(o, BaseModel):
+        return o.dict()
+    return str(o)
 
 
 class DataclassJSONResponse(JSONResponse):
     media_type = "application/json"
 
     def render(self, content: tp.Any) -> bytes:
-        return json.dumps(
-            content,
-            ensure_ascii=False,
-            allow_nan=False,
-            indent=None,
-            separators=(",", ":"),
-            cls=EnhancedJSONEncoder,
-        ).encode("utf-8")
+        return orjson.dumps(content, default=orjson_default)
 
 
 def create_response(
@@ -1,11 +1,15 @@
+import hashlib
+import hmac
+import os
 import secrets
 import string
+import time
 import typing as tp
+from base64 import b64decode, b64encode
+from dataclasses import dataclass
 from datetime import timedelta
 from uuid import UUID
 
-from passlib import hash as phash
-from pydantic.main import BaseModel
 from zxcvbn import zxcvbn
 
 from .models.common import Email
@@ -22,10 +26,67 @@ from .utils import utc_now
 
 ALPHABET = string.ascii_lowercase + string.digits
 TOKEN_LENGTH = 64
+# Bytes at or above this bound are rejected to keep characters unbiased
+TOKEN_BYTE_BOUND = 256 - 256 % len(ALPHABET)
+TOKEN_TRANSLATION = bytes(
+    ord(ALPHABET[byte % len(ALPHABET)]) for byte in range(256)
+)
+TOKEN_REJECTED_BYTES = bytes(range(TOKEN_BYTE_BOUND, 256))
+
+TokenT = tp.TypeVar("TokenT", bound=Token)
+
+# zxcvbn matching is superlinear in input length, so only a prefix is scored
+PASSWORD_STRENGTH_CHECK_LENGTH = 100
+MAX_PASSWORD_LENGTH = 1024
+
+# hashlib.pbkdf2_hmac delegates to OpenSSL, which keys the HMAC once per call
+# and reuses the inner/outer digest states for every iteration
+PASSWORD_HASH_SCHEME = "pbkdf2-sha256"
+PASSWORD_HASH_DIGEST = "sha256"
+PASSWORD_HASH_PROBE_ROUNDS = 10_000
+
+
+def ab64_encode(data: bytes) -> str:
+    # passlib's "adapted base64": no padding and "." instead of "+"
+    return b64encode(data).rstrip(b"=").replace(b"+", b".").decode("ascii")
+
+
+def ab64_decode(data: str) -> bytes:
+    encoded = data.replace(".", "+")
+    return b64decode(encoded + "=" * (-len(encoded) % 4))
+
+
+def calibrate_password_hash_rounds(min_rounds: int, time_target: float) -> int:
+    if time_target <= 0:
+        return min_rounds
+    started_at = time.perf_counter()
+    hashlib.pbkdf2_hmac(
+        PASSWORD_HASH_DIGEST,
+        b"password",
+        b"salt",
+        PASSWORD_HASH_PROBE_ROUNDS,
+    )
+    elapsed = time.perf_counter() - started_at
+    rounds = int(PASSWORD_HASH_PROBE_ROUNDS * time_target / elapsed)
+    return max(min_rounds, rounds)
+
+
+@dataclass(frozen=True)
+class SecurityService:  # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        "min_password_strength",
+        "min_password_length",
+        "password_hash_rounds",
+        "password_salt_size",
+        "registration_token_lifetime",
+        "change_email_token_lifetime",
+        "password_token_lifetime",
+        "access_token_lifetime",
+        "refresh_token_lifetime",
+    )
 
-
-class SecurityService(BaseModel):
     min_password_strength: int
+    min_password_length: int
     password_hash_rounds: int
     password_salt_size: int
     registration_token_lifetime: timedelta
@@ -36,22 +97,28 @@ class SecurityService(BaseModel):
 
     @staticmethod
     def calc_password_strength(password: str) -> int:
-        report = zxcvbn(password)
+        report = zxcvbn(password[:PASSWORD_STRENGTH_CHECK_LENGTH])
         score = report["score"]
         return score
 
     def is_password_proper(self, password: str) -> bool:
+        length = len(password)
+        if length < self.min_password_length or length > MAX_PASSWORD_LENGTH:
+            return False
         strength = self.calc_password_strength(password)
         return strength >= self.min_password_strength
 
     def hash_password(self, password: str) -> str:
+        salt = os.urandom(self.password_salt_size)
+        checksum = hashlib.pbkdf2_hmac(
+            PASSWORD_HASH_DIGEST,
+            password.encode("utf-8"),
+            salt,
+            self.password_hash_rounds,
+        )
         return (
-            phash.pbkdf2_sha256
-            .using(
-                salt_size=self.password_salt_size,
-                rounds=self.password_hash_rounds,
-            )
-            .hash(password)
+            f"${PASSWORD_HASH_SCHEME}${self.password_hash_rounds}"
+            f"${ab64_encode(salt)}${ab64_encode(checksum)}"
         )
 
     @staticmethod
@@ -59,23 +126,48 @@ class SecurityService(BaseModel):
         checked_password: str,
         hashed_password: str,
     ) -> bool:
-        return phash.pbkdf2_sha256.verify(checked_password, hashed_password)
+        try:
+            _, scheme, rounds, salt, checksum = hashed_password.split("$")
+            if scheme != PASSWORD_HASH_SCHEME:
+                return False
+            expected = ab64_decode(checksum)
+            actual = hashlib.pbkdf2_hmac(
+                PASSWORD_HASH_DIGEST,
+                checked_password.encode("utf-8"),
+                ab64_decode(salt),
+                int(rounds),
+            )
+        except ValueError:
+            return False
+        return hmac.compare_digest(actual, expected)
 
     @staticmethod
     def hash_token_string(token_string: TokenStr) -> str:
-        return phash.hex_sha256.hash(token_string)
+        return hashlib.sha256(token_string.encode("utf-8")).hexdigest()
 
     @staticmethod
     def generate_token_string() -> TokenStr:
-        return "".join(secrets.choice(ALPHABET) for _ in range(TOKEN_LENGTH))
+        token = b""
+        while len(token) < TOKEN_LENGTH:
+            token += secrets.token_bytes(TOKEN_LENGTH * 2).translate(
+                TOKEN_TRANSLATION,
+                TOKEN_REJECTED_BYTES,
+            )
+        return token[:TOKEN_LENGTH].decode("ascii")
 
-    def make_token(self, lifetime: timedelta) -> tp.Tuple[TokenStr, Token]:
+    def make_token(
+        self,
+        token_cls: tp.Type[TokenT],
+        lifetime: timedelta,
+        **fields: tp.Any,
+    ) -> tp.Tuple[TokenStr, TokenT]:
         now = utc_now()
         token_string = self.generate_token_string()
-        token = Token(
+        token = token_cls.construct(
             token=self.hash_token_string(token_string),
             created_at=now,
             expired_at=now + lifetime,
+            **fields,
         )
         return token_string, token
 
@@ -83,43 +175,50 @@ class SecurityService(BaseModel):
         self,
         user_id: UUID,
     ) -> tp.Tuple[TokenStr, RegistrationToken]:
-        token_string, token = self.make_token(self.registration_token_lifetime)
-        registration_token = RegistrationToken(**token.dict(), user_id=user_id)
-        return token_string, registration_token
+        return self.make_token(
+            RegistrationToken,
+            self.registration_token_lifetime,
+            user_id=user_id,
+        )
 
     def make_change_email_token(
         self,
         user_id: UUID,
         email: Email,
     ) -> tp.Tuple[TokenStr, ChangeEmailToken]:
-        token_string, token = self.make_token(self.change_email_token_lifetime)
-        change_email_token = ChangeEmailToken(
-            **token.dict(),
+        return self.make_token(
+            ChangeEmailToken,
+            self.change_email_token_lifetime,
             user_id=user_id,
             email=email,
         )
-        return token_string, change_email_token
 
     def make_password_token(
         self,
         user_id: UUID,
     ) -> tp.Tuple[TokenStr, PasswordToken]:
-        token_string, token = self.make_token(self.password_token_lifetime)
-        password_token = PasswordToken(**token.dict(), user_id=user_id)
-        return token_string, password_token
+        return self.make_token(
+            PasswordToken,
+            self.password_token_lifetime,
+            user_id=user_id,
+        )
 
     def make_access_token(
         self,
         session_id: UUID,
     ) -> tp.Tuple[TokenStr, AccessToken]:
-        token_string, token = self.make_token(self.access_token_lifetime)
-        access_token = AccessToken(**token.dict(), session_id=session_id)
-        return token_string, access_token
+        return self.make_token(
+            AccessToken,
+            self.access_token_lifetime,
+            session_id=session_id,
+        )
 
     def make_refresh_token(
         self,
         session_id: UUID,
     ) -> tp.Tuple[TokenStr, RefreshToken]:
-        token_string, token = self.make_token(self.refresh_token_lifetime)
-        refresh_token = RefreshToken(**token.dict(), session_id=session_id)
-        return token_string, refresh_token
+        return self.make_token(
+            RefreshToken,
+            self.refresh_token_lifetime,
+            session_id=session_id,
+        )
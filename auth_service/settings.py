@@ -29,7 +29,11 @@ class LogConfig(Config):
 
 class SecurityConfig(Config):
     min_password_strength: int = 3
+    min_password_length: int = 8
+    # Floor for PBKDF2 rounds; at startup the count is raised so one hash
+    # takes about password_hash_time_target_seconds (0 disables calibration)
     password_hash_rounds: int = 100_000
+    password_hash_time_target_seconds: float = 0.05
     password_salt_size: int = 32
     registration_token_lifetime_seconds: float = 3600 * 24 * 7
     change_email_token_lifetime_seconds: float = 3600 * 24
@@ -1,7 +1,14 @@
+import asyncio
 import datetime
+import typing as tp
 
-TZ_UTC = datetime.timezone.utc
+T = tp.TypeVar("T")
 
 
 def utc_now() -> datetime.datetime:
-    return datetime.datetime.now(TZ_UTC).replace(tzinfo=None)
+    return datetime.datetime.utcnow()
+
+
+async def run_in_executor(func: tp.Callable[..., T], *args: tp.Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, func, *args)
@@ -0,0 +1,54 @@
+"""add_token_lookup_indexes
+
+Revision ID: b1e9b99972d6
+Revises: 61c7f5ad5635
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b1e9b99972d6"
+down_revision = "61c7f5ad5635"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index(op.f("ix_email_tokens_email"), table_name="email_tokens")
+    op.create_index(
+        op.f("ix_email_tokens_email_expired_at"),
+        "email_tokens",
+        ["email", "expired_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_email_tokens_user_id"),
+        "email_tokens",
+        ["user_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_password_tokens_user_id_expired_at"),
+        "password_tokens",
+        ["user_id", "expired_at"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_password_tokens_user_id_expired_at"),
+        table_name="password_tokens",
+    )
+    op.drop_index(op.f("ix_email_tokens_user_id"), table_name="email_tokens")
+    op.drop_index(
+        op.f("ix_email_tokens_email_expired_at"),
+        table_name="email_tokens",
+    )
+    op.create_index(
+        op.f("ix_email_tokens_email"),
+        "email_tokens",
+        ["email"],
+        unique=False,
+    )
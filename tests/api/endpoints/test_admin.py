@@ -10,6 +10,8 @@ from tests.helpers import DBObjectCreator, create_authorized_user, make_db_user
 
 USER_PATH_TEMPLATE = "/users/{user_id}"
 
+USER_FIELDS = frozenset(User.schema()["properties"].keys())
+
 
 def test_get_user_success(
     client: TestClient,
@@ -25,15 +27,14 @@ def test_get_user_success(
     other_user = make_db_user()
     create_db_object(other_user)
 
-    with client:
-        resp = client.get(
-            USER_PATH_TEMPLATE.format(user_id=other_user.user_id),
-            headers={"Authorization": f"Bearer {access_token}"}
-        )
+    resp = client.get(
+        USER_PATH_TEMPLATE.format(user_id=other_user.user_id),
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
 
     assert resp.status_code == HTTPStatus.OK
     resp_json = resp.json()
-    assert set(resp_json.keys()) == set(User.schema()['properties'].keys())
+    assert set(resp_json.keys()) == USER_FIELDS
     assert resp_json["user_id"] == other_user.user_id
     assert resp_json["email"] == other_user.email
     assert resp_json["role"] == other_user.role
@@ -60,11 +61,10 @@ def test_get_user_not_found_when_not_admin(
     other_user = make_db_user()
     create_db_object(other_user)
 
-    with client:
-        resp = client.get(
-            USER_PATH_TEMPLATE.format(user_id=other_user.user_id),
-            headers={"Authorization": f"Bearer {access_token}"}
-        )
+    resp = client.get(
+        USER_PATH_TEMPLATE.format(user_id=other_user.user_id),
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
     assert resp.status_code == HTTPStatus.NOT_FOUND
 
 
@@ -79,11 +79,10 @@ def test_get_user_not_found_when_not_exists(
         user_role=UserRole.admin,
     )
 
-    with client:
-        resp = client.get(
-            USER_PATH_TEMPLATE.format(user_id=uuid4()),
-            headers={"Authorization": f"Bearer {access_token}"}
-        )
+    resp = client.get(
+        USER_PATH_TEMPLATE.format(user_id=uuid4()),
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
     assert resp.status_code == HTTPStatus.NOT_FOUND
 
 
@@ -98,9 +97,8 @@ def test_get_user_422_when_not_uuid(
         user_role=UserRole.admin,
     )
 
-    with client:
-        resp = client.get(
-            USER_PATH_TEMPLATE.format(user_id="uid"),
-            headers={"Authorization": f"Bearer {access_token}"}
-        )
+    resp = client.get(
+        USER_PATH_TEMPLATE.format(user_id="uid"),
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
     assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
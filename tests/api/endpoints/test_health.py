@@ -9,8 +9,7 @@ from auth_service.settings import ServiceConfig
 def test_ping(
     client: TestClient,
 ) -> None:
-    with client:
-        response = client.get("/ping")
+    response = client.get("/ping")
     assert response.status_code == HTTPStatus.OK
 
     expected_body = {"message": "pong"}
@@ -22,11 +21,10 @@ def test_request_id_in_response(
     service_config: ServiceConfig,
 ) -> None:
     request_id = "some_request_id"
-    with client:
-        response = client.get(
-            "/ping",
-            headers={service_config.request_id_header: request_id}
-        )
+    response = client.get(
+        "/ping",
+        headers={service_config.request_id_header: request_id}
+    )
     assert response.status_code == HTTPStatus.OK
     assert response.headers[service_config.request_id_header] == request_id
 
@@ -35,8 +33,7 @@ def test_security_headers_in_response(
     client: TestClient,
     service_config: ServiceConfig,
 ) -> None:
-    with client:
-        response = client.get("/ping")
+    response = client.get("/ping")
     assert response.status_code == HTTPStatus.OK
     for key, value in SECURITY_HEADERS.items():
         assert response.headers[key] == value
@@ -45,6 +42,5 @@ def test_security_headers_in_response(
 def test_health(
     client: TestClient,
 ) -> None:
-    with client:
-        response = client.get("/health")
+    response = client.get("/health")
     assert response.status_code == HTTPStatus.OK
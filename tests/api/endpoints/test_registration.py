@@ -4,7 +4,6 @@ from datetime import datetime, timedelta
 from http import HTTPStatus
 from uuid import UUID
 
-import orjson
 import pytest
 from sqlalchemy import orm
 from starlette.testclient import TestClient
@@ -30,6 +29,7 @@ from tests.constants import (
 )
 from tests.helpers import (
     DBObjectCreator,
+    DBObjectsCreator,
     FakeSendgridServer,
     assert_all_tables_are_empty,
     make_db_newcomer,
@@ -42,6 +42,12 @@ from tests.utils import ApproxDatetime
 REGISTRATION_PATH = "/auth/register"
 REGISTER_VERIFY_PATH = "/auth/register/verify"
 
+REGISTER_VERIFY_LINK_PATTERN = re.compile(
+    REGISTER_VERIFY_LINK_TEMPLATE
+    .replace("{token}", r"(\w+)")
+    .replace("?", r"\?")
+)
+
 REGISTER_REQUEST_BODY = {
     "name": USER_NAME,
     "email": USER_EMAIL,
@@ -62,11 +68,10 @@ def test_registration_success(
     request_body = REGISTER_REQUEST_BODY.copy()
     request_body.update({"marketing_agree": marketing_agree})
     now = utc_now()
-    with client:
-        resp = client.post(
-            REGISTRATION_PATH,
-            json=request_body,
-        )
+    resp = client.post(
+        REGISTRATION_PATH,
+        json=request_body,
+    )
 
     # Check response
     assert resp.status_code == HTTPStatus.CREATED
@@ -100,11 +105,11 @@ def test_registration_success(
     newcomer = newcomers[0]
     reg_token = reg_tokens[0]
 
-    newcomer_dict = orjson.loads(
-        orjson.dumps({k: getattr(newcomer, k) for k in resp_json.keys()})
-    )
     for field, value in resp_json.items():
-        assert newcomer_dict[field] == value
+        expected = getattr(newcomer, field)
+        if isinstance(expected, datetime):
+            expected = expected.isoformat()
+        assert expected == value
     assert security_service.is_password_correct(
         request_body["password"],  # type: ignore
         newcomer.password
@@ -142,13 +147,8 @@ def test_registration_success(
     contents = send_mail_request.json["content"]
     assert contents[0]["type"] == "text/plain"
     assert contents[1]["type"] == "text/html"
-    link_pattern = (
-        REGISTER_VERIFY_LINK_TEMPLATE
-        .replace("{token}", r"(\w+)")
-        .replace("?", r"\?")
-    )
-    text_token = re.findall(link_pattern, contents[0]["value"])[0]
-    html_token = re.findall(link_pattern, contents[1]["value"])[0]
+    text_token = REGISTER_VERIFY_LINK_PATTERN.findall(contents[0]["value"])[0]
+    html_token = REGISTER_VERIFY_LINK_PATTERN.findall(contents[1]["value"])[0]
     assert text_token == html_token
     assert security_service.hash_token_string(text_token) == reg_token.token
 
@@ -160,16 +160,45 @@ def test_strip_name_and_email(
     request_body["name"] = " ivan  "
     request_body["email"] = " i@v.an  "
 
-    with client:
-        resp = client.post(
-            REGISTRATION_PATH,
-            json=request_body,
-        )
+    resp = client.post(
+        REGISTRATION_PATH,
+        json=request_body,
+    )
 
     assert resp.json()["name"] == "ivan"
     assert resp.json()["email"] == "i@v.an"
 
 
+@pytest.mark.parametrize(
+    "email,expected_email",
+    (
+        ("x.y+z@sub.ex-ample.com", "x.y+z@sub.ex-ample.com"),
+        ("O'Neil@Example.COM", "o'neil@example.com"),
+        ("a@xn--d1a.com", "a@xn--d1a.com"),
+        ("a@д.com", "a@д.com"),
+        ("Иван@Mail.ru", "иван@mail.ru"),
+        ("ü@b.de", "ü@b.de"),
+        ("a@ß.de", "a@ß.de"),
+        ("a" * 64 + "@b.cd", "a" * 64 + "@b.cd"),
+    )
+)
+def test_registration_email_normalization(
+    client: TestClient,
+    email: str,
+    expected_email: str,
+):
+    request_body = REGISTER_REQUEST_BODY.copy()
+    request_body["email"] = email
+
+    resp = client.post(
+        REGISTRATION_PATH,
+        json=request_body,
+    )
+
+    assert resp.status_code == HTTPStatus.CREATED
+    assert resp.json()["email"] == expected_email
+
+
 @pytest.mark.parametrize(
     "request_body_updates,expected_error_loc,expected_error_key",
     (
@@ -186,11 +215,37 @@ def test_strip_name_and_email(
             "value_error.email"
         ),
         ({"email": ""}, ["body", "email"], "value_error.email"),
+        ({"email": "a<b>@c.d"}, ["body", "email"], "value_error.email"),
+        ({"email": "a,b@c.d"}, ["body", "email"], "value_error.email"),
+        ({"email": "a@b..c"}, ["body", "email"], "value_error.email"),
+        ({"email": ".a@b.c"}, ["body", "email"], "value_error.email"),
+        ({"email": "a@-b.c"}, ["body", "email"], "value_error.email"),
+        ({"email": "a@b.c."}, ["body", "email"], "value_error.email"),
+        ({"email": '"a"@b.c'}, ["body", "email"], "value_error.email"),
+        ({"email": "a@b"}, ["body", "email"], "value_error.email"),
+        ({"email": "a@b@c.d"}, ["body", "email"], "value_error.email"),
+        ({"email": "a@b.123"}, ["body", "email"], "value_error.email"),
+        ({"email": "a@1.2.3.4"}, ["body", "email"], "value_error.email"),
+        (
+            {"email": "a" * 65 + "@b.cd"},
+            ["body", "email"],
+            "value_error.email"
+        ),
         (
             {"password": "simple"},
             ["body", "password"],
             "value_error.password.improper"
         ),
+        (
+            {"password": USER_PASSWORD.ljust(1025, "a")},
+            ["body", "password"],
+            "value_error.password.improper"
+        ),
+        (
+            {"password": USER_PASSWORD[:7]},
+            ["body", "password"],
+            "value_error.password.improper"
+        ),
     )
 )
 def test_registration_validation_errors(
@@ -203,11 +258,10 @@ def test_registration_validation_errors(
 ):
     request_body = REGISTER_REQUEST_BODY.copy()
     request_body.update(request_body_updates)
-    with client:
-        resp = client.post(
-            REGISTRATION_PATH,
-            json=request_body,
-        )
+    resp = client.post(
+        REGISTRATION_PATH,
+        json=request_body,
+    )
 
     assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
     resp_json = resp.json()
@@ -229,11 +283,10 @@ def test_registration_when_user_exists(
     email = request_body["email"]
     user = make_db_user(email=email)  # type: ignore
     create_db_object(user)
-    with client:
-        resp = client.post(
-            REGISTRATION_PATH,
-            json=request_body,
-        )
+    resp = client.post(
+        REGISTRATION_PATH,
+        json=request_body,
+    )
     assert resp.status_code == HTTPStatus.CONFLICT
     assert resp.json()["errors"][0]["error_key"] == "email.already_exists"
 
@@ -267,11 +320,10 @@ def test_registration_when_newcomers_exist(
     create_db_object(expired_token)
 
     for i in range(max_same_newcomers + 1):
-        with client:
-            resp = client.post(
-                REGISTRATION_PATH,
-                json=request_body,
-            )
+        resp = client.post(
+            REGISTRATION_PATH,
+            json=request_body,
+        )
 
         if i < max_same_newcomers:
             assert resp.status_code == HTTPStatus.CREATED
@@ -283,9 +335,9 @@ def test_registration_when_newcomers_exist(
         db_session,
         [NewcomerTable, RegistrationTokenTable],
     )
-    assert len(db_session.query(NewcomerTable).all()) == 2 + max_same_newcomers
+    assert db_session.query(NewcomerTable).count() == 2 + max_same_newcomers
     assert (
-       len(db_session.query(RegistrationTokenTable).all())
+       db_session.query(RegistrationTokenTable).count()
        == 1 + max_same_newcomers
     )
 
@@ -295,7 +347,7 @@ def test_registration_when_newcomers_exist(
 def test_registration_when_requests_for_email_change_exist(
     client: TestClient,
     service_config: ServiceConfig,
-    create_db_object: DBObjectCreator,
+    create_db_objects: DBObjectsCreator,
     db_session: orm.Session,
     fake_sendgrid_server: FakeSendgridServer,
 ) -> None:
@@ -306,28 +358,28 @@ def test_registration_when_requests_for_email_change_exist(
         .max_active_requests_change_same_email
     )
 
-    for i in range(max_email_change_requests):
-        user = make_db_user()
-        create_db_object(user)
-        token = make_email_token(
+    users = [make_db_user() for _ in range(max_email_change_requests)]
+    tokens = [
+        make_email_token(
             token=f"hashed_token_{i}",
             user_id=user.user_id,
             email=request_body["email"],  # type: ignore
         )
-        create_db_object(token)
+        for i, user in enumerate(users)
+    ]
+    create_db_objects(users + tokens)
 
-    with client:
-        resp = client.post(
-            REGISTRATION_PATH,
-            json=request_body,
-        )
+    resp = client.post(
+        REGISTRATION_PATH,
+        json=request_body,
+    )
 
     assert resp.status_code == HTTPStatus.CONFLICT
     assert resp.json()["errors"][0]["error_key"] == "conflict"
 
     assert_all_tables_are_empty(db_session, [UserTable, EmailTokenTable])
     assert (
-       len(db_session.query(EmailTokenTable).all())
+       db_session.query(EmailTokenTable).count()
        == max_email_change_requests
     )
     assert len(fake_sendgrid_server.requests) == 0
@@ -346,11 +398,10 @@ def test_register_verify_success(
     create_db_object(newcomer)
     create_db_object(token)
 
-    with client:
-        resp = client.post(
-            REGISTER_VERIFY_PATH,
-            json={"token": token_string},
-        )
+    resp = client.post(
+        REGISTER_VERIFY_PATH,
+        json={"token": token_string},
+    )
 
     # Check response
     assert resp.status_code == HTTPStatus.OK
@@ -358,7 +409,7 @@ def test_register_verify_success(
 
     # Check DB
     assert_all_tables_are_empty(db_session, [UserTable, NewcomerTable])
-    assert len(db_session.query(NewcomerTable).all()) == 1
+    assert db_session.query(NewcomerTable).count() == 1
     users = db_session.query(UserTable).all()
     assert len(users) == 1
     user = users[0]
@@ -392,11 +443,10 @@ def test_register_verify_incorrect_token(
     create_db_object(newcomer)
     create_db_object(token)
 
-    with client:
-        resp = client.post(
-            REGISTER_VERIFY_PATH,
-            json={"token": "my_token"},
-        )
+    resp = client.post(
+        REGISTER_VERIFY_PATH,
+        json={"token": "my_token"},
+    )
     assert resp.status_code == HTTPStatus.FORBIDDEN
 
 
@@ -414,10 +464,9 @@ def test_register_verify_user_already_exists(
     create_db_object(token)
     create_db_object(user)
 
-    with client:
-        resp = client.post(
-            REGISTER_VERIFY_PATH,
-            json={"token": token_string},
-        )
+    resp = client.post(
+        REGISTER_VERIFY_PATH,
+        json={"token": token_string},
+    )
     assert resp.status_code == HTTPStatus.CONFLICT
     assert resp.json()["errors"][0]["error_key"] == "email.already_exists"
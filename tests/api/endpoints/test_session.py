@@ -45,11 +45,10 @@ def test_login_success(
     create_db_object(user)
 
     now = utc_now()
-    with client:
-        resp = client.post(
-            LOGIN_PATH,
-            json={"email": user.email, "password": password},
-        )
+    resp = client.post(
+        LOGIN_PATH,
+        json={"email": user.email, "password": password},
+    )
 
     assert resp.status_code == HTTPStatus.OK
     resp_json = resp.json()
@@ -62,7 +61,7 @@ def test_login_success(
         db_session,
         [UserTable, SessionTable, AccessTokenTable, RefreshTokenTable],
     )
-    assert len(db_session.query(UserTable).all()) == 1
+    assert db_session.query(UserTable).count() == 1
     sessions = db_session.query(SessionTable).all()
     access_tokens = db_session.query(AccessTokenTable).all()
     refresh_tokens = db_session.query(RefreshTokenTable).all()
@@ -107,11 +106,10 @@ def test_login_forbidden(
     user = make_db_user(email="my@e.mail", password=hashed_password)
     create_db_object(user)
 
-    with client:
-        resp = client.post(
-            LOGIN_PATH,
-            json={"email": email, "password": password},
-        )
+    resp = client.post(
+        LOGIN_PATH,
+        json={"email": email, "password": password},
+    )
 
     assert resp.status_code == HTTPStatus.FORBIDDEN
     assert resp.json()["errors"][0]["error_key"] == "credentials.invalid"
@@ -139,11 +137,10 @@ def test_login_when_email_not_confirmed(
     newcomer = make_db_newcomer(email="my@e.mail", password=hashed_password)
     create_db_object(newcomer)
 
-    with client:
-        resp = client.post(
-            LOGIN_PATH,
-            json={"email": email, "password": password},
-        )
+    resp = client.post(
+        LOGIN_PATH,
+        json={"email": email, "password": password},
+    )
 
     assert resp.status_code == HTTPStatus.FORBIDDEN
     assert resp.json()["errors"][0]["error_key"] == error_key
@@ -161,15 +158,14 @@ def test_logout_success(
         create_db_object,
     )
 
-    with client:
-        resp = client.post(
-            LOGOUT_PATH,
-            headers={"Authorization": f"Bearer {access_token}"}
-        )
+    resp = client.post(
+        LOGOUT_PATH,
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
     assert resp.status_code == HTTPStatus.OK
 
     assert_all_tables_are_empty(db_session, [UserTable, SessionTable])
-    assert len(db_session.query(UserTable).all()) == 1
+    assert db_session.query(UserTable).count() == 1
     sessions = db_session.query(SessionTable).all()
     assert len(sessions) == 1
     assert sessions[0].finished_at == ApproxDatetime(utc_now())
@@ -191,30 +187,29 @@ def test_logout_only_current_user(
         create_db_object,
     )
 
-    with client:
-        resp = client.post(
-            LOGOUT_PATH,
-            headers={"Authorization": f"Bearer {access_token}"}
-        )
+    resp = client.post(
+        LOGOUT_PATH,
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
     assert resp.status_code == HTTPStatus.OK
 
     assert_all_tables_are_empty(
         db_session,
         [UserTable, SessionTable, AccessTokenTable]
     )
-    assert len(db_session.query(UserTable).all()) == 2
+    assert db_session.query(UserTable).count() == 2
     other_session = (
         db_session
-        .query(SessionTable)
+        .query(SessionTable.session_id, SessionTable.finished_at)
         .filter_by(user_id=other_user.user_id)
-        .first()
+        .one()
     )
     assert other_session.finished_at is None
-    assert len(
+    assert (
         db_session
         .query(AccessTokenTable)
         .filter_by(session_id=other_session.session_id)
-        .all()
+        .count()
     ) == 1
 
 
@@ -235,13 +230,12 @@ def test_refresh_success(
         create_db_object,
     )
 
-    session_id = db_session.query(AccessTokenTable).first().session_id
+    session_id = db_session.query(AccessTokenTable.session_id).scalar()
     token_string, token = security_service.make_access_token(uuid4())
     token_db = make_refresh_token(token.token, session_id=session_id)
     create_db_object(token_db)
 
-    with client:
-        resp = client.post(REFRESH_PATH, json={"token": token_string})
+    resp = client.post(REFRESH_PATH, json={"token": token_string})
 
     assert resp.status_code == HTTPStatus.OK
     resp_json = resp.json()
@@ -251,10 +245,10 @@ def test_refresh_success(
         db_session,
         [UserTable, SessionTable, AccessTokenTable, RefreshTokenTable]
     )
-    assert len(db_session.query(UserTable).all()) == 1
-    assert len(db_session.query(SessionTable).all()) == 1
-    assert len(db_session.query(AccessTokenTable).all()) == 2
-    refresh_tokens = db_session.query(RefreshTokenTable).all()
+    assert db_session.query(UserTable).count() == 1
+    assert db_session.query(SessionTable).count() == 1
+    assert db_session.query(AccessTokenTable).count() == 2
+    refresh_tokens = db_session.query(RefreshTokenTable.token).all()
     assert len(refresh_tokens) == 1
 
     hashed_new_refresh_token = security_service.hash_token_string(
@@ -267,8 +261,7 @@ def test_refresh_forbidden_when_not_exist(
     client: TestClient,
 ) -> None:
 
-    with client:
-        resp = client.post(REFRESH_PATH, json={"token": "some_token"})
+    resp = client.post(REFRESH_PATH, json={"token": "some_token"})
 
     assert resp.status_code == HTTPStatus.FORBIDDEN
 
@@ -284,7 +277,7 @@ def test_refresh_forbidden_when_expired(
         create_db_object,
     )
 
-    session_id = db_session.query(AccessTokenTable).first().session_id
+    session_id = db_session.query(AccessTokenTable.session_id).scalar()
     token_string, token = security_service.make_access_token(uuid4())
     token_db = make_refresh_token(
         token.token,
@@ -293,7 +286,6 @@ def test_refresh_forbidden_when_expired(
     )
     create_db_object(token_db)
 
-    with client:
-        resp = client.post(REFRESH_PATH, json={"token": token_string})
+    resp = client.post(REFRESH_PATH, json={"token": token_string})
 
     assert resp.status_code == HTTPStatus.FORBIDDEN
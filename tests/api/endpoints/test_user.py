@@ -27,9 +27,11 @@ from auth_service.utils import utc_now
 from tests.constants import (
     CHANGE_EMAIL_LINK_TEMPLATE,
     RESET_PASSWORD_LINK_TEMPLATE,
+    USER_PASSWORD,
 )
 from tests.helpers import (
     DBObjectCreator,
+    DBObjectsCreator,
     FakeSendgridServer,
     assert_all_tables_are_empty,
     create_authorized_user,
@@ -48,6 +50,19 @@ VERIFY_EMAIL_PATH = "/users/me/email/verify"
 FORGOT_PASSWORD_PATH = "/users/me/password/forgot"
 RESET_PASSWORD_PATH = "/users/me/password/reset"
 
+CHANGE_EMAIL_LINK_PATTERN = re.compile(
+    CHANGE_EMAIL_LINK_TEMPLATE
+    .replace("{token}", r"(\w+)")
+    .replace("?", r"\?")
+)
+RESET_PASSWORD_LINK_PATTERN = re.compile(
+    RESET_PASSWORD_LINK_TEMPLATE
+    .replace("{token}", r"(\w+)")
+    .replace("?", r"\?")
+)
+
+USER_FIELDS = frozenset(User.schema()["properties"].keys())
+
 
 def test_get_me_success(
     client: TestClient,
@@ -59,15 +74,14 @@ def test_get_me_success(
         create_db_object,
     )
 
-    with client:
-        resp = client.get(
-            ME_PATH,
-            headers={"Authorization": f"Bearer {access_token}"}
-        )
+    resp = client.get(
+        ME_PATH,
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
 
     assert resp.status_code == HTTPStatus.OK
     resp_json = resp.json()
-    assert set(resp_json.keys()) == set(User.schema()['properties'].keys())
+    assert set(resp_json.keys()) == USER_FIELDS
     assert resp_json["user_id"] == user.user_id
 
 
@@ -92,16 +106,15 @@ def test_patch_me_success(
         "name": "my_new_name",
         "marketing_agree": False,
     }
-    with client:
-        resp = client.patch(
-            ME_PATH,
-            headers={"Authorization": f"Bearer {access_token}"},
-            json=new_info,
-        )
+    resp = client.patch(
+        ME_PATH,
+        headers={"Authorization": f"Bearer {access_token}"},
+        json=new_info,
+    )
 
     assert resp.status_code == HTTPStatus.OK
     resp_json = resp.json()
-    assert set(resp_json.keys()) == set(User.schema()['properties'].keys())
+    assert set(resp_json.keys()) == USER_FIELDS
     assert resp_json["user_id"] == user.user_id
     assert resp_json["name"] == new_info["name"]
     assert resp_json["marketing_agree"] == new_info["marketing_agree"]
@@ -133,12 +146,11 @@ def test_patch_me_validation_errors(
         security_service,
         create_db_object,
     )
-    with client:
-        resp = client.patch(
-            ME_PATH,
-            headers={"Authorization": f"Bearer {access_token}"},
-            json=request_body,
-        )
+    resp = client.patch(
+        ME_PATH,
+        headers={"Authorization": f"Bearer {access_token}"},
+        json=request_body,
+    )
 
     assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
     resp_json = resp.json()
@@ -164,12 +176,11 @@ def test_patch_my_password_success(
         create_db_object,
         hashed_password=security_service.hash_password(password),
     )
-    with client:
-        resp = client.patch(
-            MY_PASSWORD,
-            headers={"Authorization": f"Bearer {access_token}"},
-            json={"password": password, "new_password": new_password},
-        )
+    resp = client.patch(
+        MY_PASSWORD,
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"password": password, "new_password": new_password},
+    )
 
     assert resp.status_code == HTTPStatus.OK
     assert resp.json() == {}
@@ -198,12 +209,11 @@ def test_patch_my_password_with_invalid_old_password(
         create_db_object,
         hashed_password=security_service.hash_password("pass"),
     )
-    with client:
-        resp = client.patch(
-            MY_PASSWORD,
-            headers={"Authorization": f"Bearer {access_token}"},
-            json={"password": "invalid", "new_password": "Very$tr0ng!"},
-        )
+    resp = client.patch(
+        MY_PASSWORD,
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"password": "invalid", "new_password": "Very$tr0ng!"},
+    )
 
     assert resp.status_code == HTTPStatus.FORBIDDEN
     assert resp.json()["errors"][0]["error_key"] == "password.invalid"
@@ -218,12 +228,11 @@ def test_patch_my_password_with_weak_new_password(
         security_service,
         create_db_object,
     )
-    with client:
-        resp = client.patch(
-            MY_PASSWORD,
-            headers={"Authorization": f"Bearer {access_token}"},
-            json={"password": "pass", "new_password": "weak"},
-        )
+    resp = client.patch(
+        MY_PASSWORD,
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"password": "pass", "new_password": "weak"},
+    )
 
     assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
     assert (
@@ -251,12 +260,11 @@ def test_patch_email_success(
     new_email = "new@e.mail"
     request_email = "  NeW@e.maiL "
     now = utc_now()
-    with client:
-        resp = client.patch(
-            MY_EMAIL,
-            json={"password": password, "new_email": request_email},
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
+    resp = client.patch(
+        MY_EMAIL,
+        json={"password": password, "new_email": request_email},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
 
     # Check response
     assert resp.status_code == HTTPStatus.OK
@@ -307,13 +315,8 @@ def test_patch_email_success(
     contents = send_mail_request.json["content"]
     assert contents[0]["type"] == "text/plain"
     assert contents[1]["type"] == "text/html"
-    link_pattern = (
-        CHANGE_EMAIL_LINK_TEMPLATE
-        .replace("{token}", r"(\w+)")
-        .replace("?", r"\?")
-    )
-    text_token = re.findall(link_pattern, contents[0]["value"])[0]
-    html_token = re.findall(link_pattern, contents[1]["value"])[0]
+    text_token = CHANGE_EMAIL_LINK_PATTERN.findall(contents[0]["value"])[0]
+    html_token = CHANGE_EMAIL_LINK_PATTERN.findall(contents[1]["value"])[0]
     assert text_token == html_token
     assert security_service.hash_token_string(text_token) == email_token.token
 
@@ -334,12 +337,11 @@ def test_patch_my_email_with_invalid_password(
         create_db_object,
         hashed_password=security_service.hash_password("pass"),
     )
-    with client:
-        resp = client.patch(
-            MY_EMAIL,
-            headers={"Authorization": f"Bearer {access_token}"},
-            json={"password": "invalid", "new_email": "new@e.mail"},
-        )
+    resp = client.patch(
+        MY_EMAIL,
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"password": "invalid", "new_email": "new@e.mail"},
+    )
 
     assert resp.status_code == HTTPStatus.FORBIDDEN
     assert resp.json()["errors"][0]["error_key"] == "password.invalid"
@@ -360,12 +362,11 @@ def test_patch_my_email_with_invalid_email(
         create_db_object,
         hashed_password=security_service.hash_password("pass"),
     )
-    with client:
-        resp = client.patch(
-            MY_EMAIL,
-            headers={"Authorization": f"Bearer {access_token}"},
-            json={"password": "pass", "new_email": new_email},
-        )
+    resp = client.patch(
+        MY_EMAIL,
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"password": "pass", "new_email": new_email},
+    )
 
     assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
     assert resp.json()["errors"][0]["error_key"] == "value_error.email"
@@ -388,16 +389,15 @@ def test_patch_my_email_when_user_exists(
         hashed_password=security_service.hash_password(password),
     )
 
-    with client:
-        resp = client.patch(
-            MY_EMAIL,
-            headers={"Authorization": f"Bearer {access_token}"},
-            json={"password": password, "new_email": new_email},
-        )
+    resp = client.patch(
+        MY_EMAIL,
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"password": password, "new_email": new_email},
+    )
     assert resp.status_code == HTTPStatus.CONFLICT
     assert resp.json()["errors"][0]["error_key"] == "email.already_exists"
 
-    assert len(db_session.query(EmailTokenTable).all()) == 0
+    assert db_session.query(EmailTokenTable).count() == 0
     assert len(fake_sendgrid_server.requests) == 0
 
 
@@ -405,6 +405,7 @@ def test_patch_my_email_when_newcomers_exist(
     client: TestClient,
     service_config: ServiceConfig,
     create_db_object: DBObjectCreator,
+    create_db_objects: DBObjectsCreator,
     db_session: orm.Session,
     security_service: SecurityService,
     fake_sendgrid_server: FakeSendgridServer,
@@ -416,14 +417,17 @@ def test_patch_my_email_when_newcomers_exist(
     )
 
     new_email = "new@e.mail"
-    for i in range(max_same_newcomers):
-        newcomer = make_db_newcomer(email=new_email)
-        create_db_object(newcomer)
-        reg_token = make_db_registration_token(
+    newcomers = [
+        make_db_newcomer(email=new_email) for _ in range(max_same_newcomers)
+    ]
+    reg_tokens = [
+        make_db_registration_token(
             token=f"hashed_token_{i}",
             user_id=newcomer.user_id,
         )
-        create_db_object(reg_token)
+        for i, newcomer in enumerate(newcomers)
+    ]
+    create_db_objects(newcomers + reg_tokens)
 
     password = "pass"
     _, access_token = create_authorized_user(
@@ -432,17 +436,16 @@ def test_patch_my_email_when_newcomers_exist(
         hashed_password=security_service.hash_password(password),
     )
 
-    with client:
-        resp = client.patch(
-            MY_EMAIL,
-            headers={"Authorization": f"Bearer {access_token}"},
-            json={"password": password, "new_email": new_email},
-        )
+    resp = client.patch(
+        MY_EMAIL,
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"password": password, "new_email": new_email},
+    )
 
     assert resp.status_code == HTTPStatus.CONFLICT
     assert resp.json()["errors"][0]["error_key"] == "conflict"
 
-    assert len(db_session.query(EmailTokenTable).all()) == 0
+    assert db_session.query(EmailTokenTable).count() == 0
     assert len(fake_sendgrid_server.requests) == 0
 
 
@@ -450,6 +453,7 @@ def test_patch_my_email_when_requests_for_email_change_exist(
     client: TestClient,
     service_config: ServiceConfig,
     create_db_object: DBObjectCreator,
+    create_db_objects: DBObjectsCreator,
     db_session: orm.Session,
     security_service: SecurityService,
 
@@ -462,15 +466,16 @@ def test_patch_my_email_when_requests_for_email_change_exist(
     )
 
     new_email = "new@e.mail"
-    for i in range(max_email_requests):
-        user = make_db_user()
-        create_db_object(user)
-        token = make_email_token(
+    users = [make_db_user() for _ in range(max_email_requests)]
+    tokens = [
+        make_email_token(
             token=f"hashed_token_{i}",
             user_id=user.user_id,
             email=new_email,
         )
-        create_db_object(token)
+        for i, user in enumerate(users)
+    ]
+    create_db_objects(users + tokens)
 
     password = "pass"
     user, access_token = create_authorized_user(
@@ -479,17 +484,16 @@ def test_patch_my_email_when_requests_for_email_change_exist(
         hashed_password=security_service.hash_password(password),
     )
 
-    with client:
-        resp = client.patch(
-            MY_EMAIL,
-            headers={"Authorization": f"Bearer {access_token}"},
-            json={"password": password, "new_email": new_email},
-        )
+    resp = client.patch(
+        MY_EMAIL,
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"password": password, "new_email": new_email},
+    )
 
     assert resp.status_code == HTTPStatus.CONFLICT
     assert resp.json()["errors"][0]["error_key"] == "conflict"
 
-    assert len(db_session.query(EmailTokenTable).all()) == max_email_requests
+    assert db_session.query(EmailTokenTable).count() == max_email_requests
     assert len(fake_sendgrid_server.requests) == 0
 
 
@@ -507,11 +511,10 @@ def test_change_email_verify_success(
     create_db_object(user)
     create_db_object(token)
 
-    with client:
-        resp = client.post(
-            VERIFY_EMAIL_PATH,
-            json={"token": token_string},
-        )
+    resp = client.post(
+        VERIFY_EMAIL_PATH,
+        json={"token": token_string},
+    )
     assert resp.status_code == HTTPStatus.OK
 
     assert_all_tables_are_empty(db_session, [UserTable])
@@ -544,11 +547,10 @@ def test_register_verify_incorrect_token(
     create_db_object(user)
     create_db_object(token)
 
-    with client:
-        resp = client.post(
-            VERIFY_EMAIL_PATH,
-            json={"token": "my_token"},
-        )
+    resp = client.post(
+        VERIFY_EMAIL_PATH,
+        json={"token": "my_token"},
+    )
     assert resp.status_code == HTTPStatus.FORBIDDEN
 
 
@@ -568,11 +570,10 @@ def test_email_verify_user_already_exists(
     other_user = make_db_user(email=email)
     create_db_object(other_user)
 
-    with client:
-        resp = client.post(
-            VERIFY_EMAIL_PATH,
-            json={"token": token_string},
-        )
+    resp = client.post(
+        VERIFY_EMAIL_PATH,
+        json={"token": token_string},
+    )
     assert resp.status_code == HTTPStatus.CONFLICT
     assert resp.json()["errors"][0]["error_key"] == "email.already_exists"
 
@@ -589,11 +590,10 @@ def test_forgot_password_success(
     create_db_object(user)
 
     now = utc_now()
-    with client:
-        resp = client.post(
-            FORGOT_PASSWORD_PATH,
-            json={"email": " " + user.email.capitalize() + "   "},
-        )
+    resp = client.post(
+        FORGOT_PASSWORD_PATH,
+        json={"email": " " + user.email.capitalize() + "   "},
+    )
 
     # Check response
     assert resp.status_code == HTTPStatus.ACCEPTED
@@ -601,7 +601,7 @@ def test_forgot_password_success(
 
     # # Check DB content
     assert_all_tables_are_empty(db_session, [UserTable, PasswordTokenTable])
-    assert len(db_session.query(UserTable).all()) == 1
+    assert db_session.query(UserTable).count() == 1
     password_tokens = db_session.query(PasswordTokenTable).all()
     assert len(password_tokens) == 1
     password_token = password_tokens[0]
@@ -638,13 +638,8 @@ def test_forgot_password_success(
     contents = send_mail_request.json["content"]
     assert contents[0]["type"] == "text/plain"
     assert contents[1]["type"] == "text/html"
-    link_pattern = (
-        RESET_PASSWORD_LINK_TEMPLATE
-        .replace("{token}", r"(\w+)")
-        .replace("?", r"\?")
-    )
-    text_token = re.findall(link_pattern, contents[0]["value"])[0]
-    html_token = re.findall(link_pattern, contents[1]["value"])[0]
+    text_token = RESET_PASSWORD_LINK_PATTERN.findall(contents[0]["value"])[0]
+    html_token = RESET_PASSWORD_LINK_PATTERN.findall(contents[1]["value"])[0]
     assert text_token == html_token
     assert (
         security_service.hash_token_string(text_token)
@@ -658,11 +653,10 @@ def test_forgot_password_with_invalid_email(
     create_db_object: DBObjectCreator,
 ) -> None:
 
-    with client:
-        resp = client.post(
-            FORGOT_PASSWORD_PATH,
-            json={"email": "not_a_email"},
-        )
+    resp = client.post(
+        FORGOT_PASSWORD_PATH,
+        json={"email": "not_a_email"},
+    )
 
     assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
     assert resp.json()["errors"][0]["error_key"] == "value_error.email"
@@ -673,11 +667,10 @@ def test_forgot_password_when_email_not_exists(
     db_session: orm.Session,
     fake_sendgrid_server: FakeSendgridServer,
 ):
-    with client:
-        resp = client.post(
-            FORGOT_PASSWORD_PATH,
-            json={"email": "a@b.c"},
-        )
+    resp = client.post(
+        FORGOT_PASSWORD_PATH,
+        json={"email": "a@b.c"},
+    )
 
     assert resp.status_code == HTTPStatus.ACCEPTED
     assert resp.json() == {}
@@ -711,14 +704,13 @@ def test_forgot_password_when_too_many_requests(
     create_db_object(expired_token)
 
     for i in range(max_password_tokens + 1):
-        with client:
-            resp = client.post(
-                FORGOT_PASSWORD_PATH,
-                json={"email": user.email},
-            )
+        resp = client.post(
+            FORGOT_PASSWORD_PATH,
+            json={"email": user.email},
+        )
         assert resp.status_code == HTTPStatus.ACCEPTED
 
-        n_tokens = len(db_session.query(PasswordTokenTable).all())
+        n_tokens = db_session.query(PasswordTokenTable).count()
         n_mails = len(fake_sendgrid_server.requests)
         if i < max_password_tokens:
             assert n_tokens == i + 2
@@ -742,11 +734,10 @@ def test_password_reset_success(
     create_db_object(token)
 
     password = "VeryH@rdPa$$w0rd"
-    with client:
-        resp = client.post(
-            RESET_PASSWORD_PATH,
-            json={"token": token_string, "password": password},
-        )
+    resp = client.post(
+        RESET_PASSWORD_PATH,
+        json={"token": token_string, "password": password},
+    )
     assert resp.status_code == HTTPStatus.OK
 
     assert_all_tables_are_empty(db_session, [UserTable])
@@ -755,16 +746,24 @@ def test_password_reset_success(
     assert security_service.is_password_correct(password, users[0].password)
 
 
+@pytest.mark.parametrize(
+    "password",
+    (
+        "weak",
+        USER_PASSWORD.ljust(1025, "a"),
+        USER_PASSWORD[:7],
+    )
+)
 def test_reset_password_with_weak_new_password(
     client: TestClient,
     security_service: SecurityService,
     create_db_object: DBObjectCreator,
+    password: str,
 ) -> None:
-    with client:
-        resp = client.post(
-            RESET_PASSWORD_PATH,
-            json={"token": "hashed_token", "password": "weak"},
-        )
+    resp = client.post(
+        RESET_PASSWORD_PATH,
+        json={"token": "hashed_token", "password": password},
+    )
 
     assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
     assert (
@@ -800,14 +799,13 @@ def test_reset_password_incorrect_token(
     create_db_object(token)
 
     password = "VeryH@rdPa$$w0rd"
-    with client:
-        resp = client.post(
-            RESET_PASSWORD_PATH,
-            json={"token": "my_token", "password": password},
-        )
+    resp = client.post(
+        RESET_PASSWORD_PATH,
+        json={"token": "my_token", "password": password},
+    )
     assert resp.status_code == HTTPStatus.FORBIDDEN
 
-    assert len(db_session.query(PasswordTokenTable).all()) == 1
+    assert db_session.query(PasswordTokenTable).count() == 1
     users = db_session.query(UserTable).all()
     assert len(users) == 1
     user = users[0]
@@ -32,6 +32,7 @@ from .constants import (
 )
 from .helpers import (
     DBObjectCreator,
+    DBObjectsCreator,
     FakeSendgridServer,
     check_access_forbidden,
 )
@@ -42,7 +43,10 @@ ALEMBIC_INI_PATH = CURRENT_DIR.parent / "alembic.ini"
 
 @contextmanager
 def sqlalchemy_bind_context(url: str) -> tp.Iterator[sa.engine.Engine]:
-    bind = sa.engine.create_engine(url)
+    bind = sa.engine.create_engine(
+        url,
+        connect_args={"options": "-c synchronous_commit=off"},
+    )
     try:
         yield bind
     finally:
@@ -72,6 +76,16 @@ def migrations_context(alembic_ini: Path) -> tp.Iterator[None]:
         alembic_command.downgrade(cfg, "base")
 
 
+@contextmanager
+def tables_cleanup_context(bind: sa.engine.Engine) -> tp.Iterator[None]:
+    try:
+        yield
+    finally:
+        tables = ", ".join(t.name for t in Base.metadata.sorted_tables)
+        with bind.begin() as conn:
+            conn.execute(sa.text(f"TRUNCATE {tables}"))
+
+
 @pytest.fixture(scope="session")
 def db_url() -> str:
     return os.getenv("DB_URL")
@@ -83,9 +97,18 @@ def db_bind(db_url: str) -> tp.Iterator[sa.engine.Engine]:
         yield bind
 
 
-@pytest.fixture
-def db_session(db_bind: sa.engine.Engine) -> tp.Iterator[orm.Session]:
+@pytest.fixture(scope="session")
+def migrations(db_bind: sa.engine.Engine) -> tp.Iterator[None]:
     with migrations_context(ALEMBIC_INI_PATH):
+        yield
+
+
+@pytest.fixture
+def db_session(
+    db_bind: sa.engine.Engine,
+    migrations: None,
+) -> tp.Iterator[orm.Session]:
+    with tables_cleanup_context(db_bind):
         with sqlalchemy_session_context(db_bind) as session:
             yield session
 
@@ -125,6 +148,19 @@ def create_db_object(
     return create
 
 
+@pytest.fixture
+def create_db_objects(
+    db_session: orm.Session,
+) -> DBObjectsCreator:
+    assert db_session.is_active
+
+    def create(objs: tp.Iterable[Base]) -> None:
+        db_session.add_all(objs)
+        db_session.commit()
+
+    return create
+
+
 @pytest.fixture
 def set_env(sendgrid_server_url: str) -> tp.Generator[None, None, None]:
     monkeypatch = MonkeyPatch()
@@ -143,6 +179,8 @@ def set_env(sendgrid_server_url: str) -> tp.Generator[None, None, None]:
     )
     monkeypatch.setenv("SENDGRID_API_KEY", SENDGRID_API_KEY)
     monkeypatch.setenv("SENDGRID_URL", sendgrid_server_url)
+    monkeypatch.setenv("PASSWORD_HASH_ROUNDS", "1")
+    monkeypatch.setenv("PASSWORD_HASH_TIME_TARGET_SECONDS", "0")
 
     yield
 
@@ -172,8 +210,9 @@ def app(service_config: ServiceConfig, db_session: orm.Session) -> FastAPI:
 
 
 @pytest.fixture
-def client(app: FastAPI) -> TestClient:
-    return TestClient(app=app)
+def client(app: FastAPI) -> tp.Iterator[TestClient]:
+    with TestClient(app=app) as client:
+        yield client
 
 
 @pytest.fixture
@@ -26,6 +26,7 @@ from auth_service.settings import ServiceConfig
 from auth_service.utils import utc_now
 from tests.helpers import (
     DBObjectCreator,
+    DBObjectsCreator,
     make_db_newcomer,
     make_db_registration_token,
     make_db_user,
@@ -90,23 +91,24 @@ async def test_registration_when_newcomers_exist_with_parallel_requests(
     finally:
         await db_service.cleanup()
 
-    assert len(db_session.query(NewcomerTable).all()) == max_same_newcomers
+    assert db_session.query(NewcomerTable).count() == max_same_newcomers
 
 
 async def test_verification_when_users_exist_with_parallel_requests(
     service_config: ServiceConfig,
     db_service: DBService,
     db_session: orm.Session,
-    create_db_object: DBObjectCreator
+    create_db_objects: DBObjectsCreator
 ) -> None:
     n = 10
 
     token_hashes = [f"token_{i}_hash" for i in range(n)]
-    for hashed in token_hashes:
-        newcomer = make_db_newcomer(email="e@m.ail")
-        token = make_db_registration_token(hashed, user_id=newcomer.user_id)
-        create_db_object(newcomer)
-        create_db_object(token)
+    newcomers = [make_db_newcomer(email="e@m.ail") for _ in token_hashes]
+    tokens = [
+        make_db_registration_token(hashed, user_id=newcomer.user_id)
+        for hashed, newcomer in zip(token_hashes, newcomers)
+    ]
+    create_db_objects(newcomers + tokens)
 
     tasks = [
         db_service.verify_newcomer(token_hash)
@@ -121,7 +123,7 @@ async def test_verification_when_users_exist_with_parallel_requests(
     finally:
         await db_service.cleanup()
 
-    assert len(db_session.query(UserTable).all()) == 1
+    assert db_session.query(UserTable).count() == 1
 
 
 async def test_update_passwords_with_parallel_requests(
@@ -136,7 +138,7 @@ async def test_update_passwords_with_parallel_requests(
 
     new_passwords = [f"hashed_password_{i}" for i in range(n)]
 
-    def is_password_valid(password: str) -> bool:
+    async def is_password_valid(password: str) -> bool:
         return password == user.password
 
     tasks = [
@@ -165,7 +167,7 @@ async def test_many_change_same_email_parallel_requests(
     db_service: DBService,
     db_session: orm.Session,
     security_service: SecurityService,
-    create_db_object: DBObjectCreator,
+    create_db_objects: DBObjectsCreator,
 ) -> None:
     email = Email("a@b.c")
 
@@ -175,8 +177,7 @@ async def test_many_change_same_email_parallel_requests(
         .max_active_requests_change_same_email
     )
     users = [make_db_user() for _ in range(max_email_changes * 3)]
-    for user in users:
-        create_db_object(user)
+    create_db_objects(users)
     change_email_tokens = [
         security_service.make_change_email_token(user.user_id, email)[1]
         for user in users
@@ -194,24 +195,25 @@ async def test_many_change_same_email_parallel_requests(
     finally:
         await db_service.cleanup()
 
-    assert len(db_session.query(EmailTokenTable).all()) == max_email_changes
+    assert db_session.query(EmailTokenTable).count() == max_email_changes
 
 
 async def test_verify_same_email_with_parallel_requests(
     service_config: ServiceConfig,
     db_service: DBService,
     db_session: orm.Session,
-    create_db_object: DBObjectCreator
+    create_db_objects: DBObjectsCreator
 ) -> None:
     n = 10
 
     email = "new@email.ru"
     token_hashes = [f"token_{i}_hash" for i in range(n)]
-    for hashed in token_hashes:
-        user = make_db_user()
-        token = make_email_token(hashed, user_id=user.user_id, email=email)
-        create_db_object(user)
-        create_db_object(token)
+    users = [make_db_user() for _ in token_hashes]
+    tokens = [
+        make_email_token(hashed, user_id=user.user_id, email=email)
+        for hashed, user in zip(token_hashes, users)
+    ]
+    create_db_objects(users + tokens)
 
     tasks = [
         is_func_executed(
@@ -264,6 +266,6 @@ async def test_many_forgot_password_parallel_requests(
         await db_service.cleanup()
 
     assert (
-        len(db_session.query(PasswordTokenTable).all())
+        db_session.query(PasswordTokenTable).count()
         == max_password_tokens
     )
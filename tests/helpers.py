@@ -1,11 +1,13 @@
 import typing as tp
 from datetime import datetime, timedelta
+from functools import lru_cache
 from http import HTTPStatus
 from uuid import UUID, uuid4
 
 import orjson
 import werkzeug
 from sqlalchemy import inspect, orm
+from sqlalchemy.engine import Engine
 from sqlalchemy.sql import text
 from starlette.testclient import TestClient
 
@@ -27,9 +29,14 @@ from auth_service.utils import utc_now
 from .utils import random_email
 
 DBObjectCreator = tp.Callable[[Base], None]
+DBObjectsCreator = tp.Callable[[tp.Iterable[Base]], None]
+
+
+SENDGRID_ERROR_BODY = orjson.dumps({"error": "some error"})
 
 
 class FakeSendgridServer:
+    __slots__ = ("requests", "return_error")
 
     def __init__(self) -> None:
         self.requests: tp.List[werkzeug.Request] = []
@@ -45,7 +52,7 @@ class FakeSendgridServer:
         self.requests.append(request)
         if self.return_error:
             return werkzeug.Response(
-                orjson.dumps({"error": "some error"}),
+                SENDGRID_ERROR_BODY,
                 status=HTTPStatus.INTERNAL_SERVER_ERROR,
                 content_type="application/json"
             )
@@ -56,18 +63,28 @@ class FakeSendgridServer:
         )
 
 
+@lru_cache(maxsize=None)
+def get_table_names(bind: Engine) -> tp.FrozenSet[str]:
+    return frozenset(inspect(bind).get_table_names())
+
+
 def assert_all_tables_are_empty(
     db_session: orm.Session,
     exclude: tp.Collection[Base] = (),
 ) -> None:
-    inspector = inspect(db_session.get_bind())
-    tables_all = inspector.get_table_names()
+    tables_all = get_table_names(db_session.get_bind())
     exclude_names = [e.__tablename__ for e in exclude]
     tables = set(tables_all) - (set(exclude_names) | {"alembic_version"})
-    for table in tables:
-        request = text(f"SELECT COUNT(*) FROM {table}")
-        count = db_session.execute(request).fetchone()[0]
-        assert count == 0
+    if not tables:
+        return
+    request = text(
+        " UNION ALL ".join(
+            f"SELECT '{table}' WHERE EXISTS (SELECT 1 FROM {table})"
+            for table in sorted(tables)
+        )
+    )
+    not_empty = [row[0] for row in db_session.execute(request)]
+    assert not_empty == []
 
 
 def make_db_user(
@@ -224,33 +241,39 @@ def check_access_forbidden(
     request_params: tp.Dict[str, tp.Any],
     expected_status: HTTPStatus = HTTPStatus.FORBIDDEN,
 ) -> None:
+    _, valid_token = create_authorized_user(
+        security_service,
+        create_db_object,
+        token_expired_at=utc_now() + timedelta(hours=1),
+    )
+    _, expired_token = create_authorized_user(
+        security_service,
+        create_db_object,
+        token_expired_at=utc_now() - timedelta(seconds=1),
+    )
     cases = (
-        ("NotAuthorization", "Bearer ", None, "authorization.not_set"),
-        ("Authorization", "Bearer", None, "authorization.scheme_unrecognised"),
-        ("Authorization", "NotBearer ", None, "authorization.scheme_invalid"),
+        ("NotAuthorization", "Bearer ", valid_token, "authorization.not_set"),
+        (
+            "Authorization",
+            "Bearer",
+            valid_token,
+            "authorization.scheme_unrecognised",
+        ),
+        (
+            "Authorization",
+            "NotBearer ",
+            valid_token,
+            "authorization.scheme_invalid",
+        ),
         ("Authorization", "Bearer ", "incorrect_token", "forbidden"),
-        ("Authorization", "Bearer ", "expired_token", "forbidden"),
+        ("Authorization", "Bearer ", expired_token, "forbidden"),
     )
 
     for key, value_beginning, token, expected_error_key in cases:
-        if token == "expired_token":
-            token_expired_at = utc_now() - timedelta(seconds=1)
-            token = None
-        else:
-            token_expired_at = utc_now() + timedelta(hours=1)
-
-        _, access_token = create_authorized_user(
-            security_service,
-            create_db_object,
-            token_expired_at=token_expired_at,
+        resp = client.request(
+            **request_params,
+            headers={key: value_beginning + token}
         )
-        token = token or access_token
-
-        with client:
-            resp = client.request(
-                **request_params,
-                headers={key: value_beginning + token}
-            )
 
         assert resp.status_code == expected_status
         if expected_status == HTTPStatus.FORBIDDEN:
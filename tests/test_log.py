@@ -0,0 +1,73 @@
+import io
+import logging
+import os
+import time
+import typing as tp
+
+import orjson
+from starlette.datastructures import URL
+
+from auth_service.context import REQUEST_ID
+from auth_service.log import (
+    JSONAccessHandler,
+    RequestIDFilter,
+    ServiceNameFilter,
+)
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def make_access_logger(stream: tp.TextIO) -> logging.Logger:
+    handler = JSONAccessHandler(stream, DATETIME_FORMAT)
+    handler.addFilter(ServiceNameFilter(service_name="auth_service"))
+    handler.addFilter(RequestIDFilter())
+    logger = logging.Logger("access")
+    logger.addHandler(handler)
+    return logger
+
+
+def log_access_record(stream: tp.TextIO) -> None:
+    logger = make_access_logger(stream)
+    token = REQUEST_ID.set("some_request_id")
+    try:
+        logger.info(
+            msg="",
+            extra={
+                "request_time": 0.0123,
+                "status_code": 201,
+                "requested_url": URL("http://testserver/path?a=b"),
+                "method": "POST",
+            },
+        )
+    finally:
+        REQUEST_ID.reset(token)
+
+
+def check_access_lines(lines: tp.List[bytes]) -> None:
+    assert len(lines) == 1
+    record = orjson.loads(lines[0])
+    time.strptime(record.pop("time"), DATETIME_FORMAT)
+    assert record == {
+        "level": "INFO",
+        "service_name": "auth_service",
+        "logger": "access",
+        "pid": os.getpid(),
+        "request_id": "some_request_id",
+        "method": "POST",
+        "requested_url": "http://testserver/path?a=b",
+        "status_code": 201,
+        "request_time": 0.0123,
+    }
+
+
+def test_json_access_handler_writes_to_buffer() -> None:
+    buffer = io.BytesIO()
+    stream = io.TextIOWrapper(buffer)
+    log_access_record(stream)
+    check_access_lines(buffer.getvalue().splitlines())
+
+
+def test_json_access_handler_writes_to_text_stream() -> None:
+    stream = io.StringIO()
+    log_access_record(stream)
+    check_access_lines(stream.getvalue().encode().splitlines())
@@ -0,0 +1,87 @@
+from datetime import timedelta
+
+import pytest
+from passlib.hash import pbkdf2_sha256
+
+from auth_service.security import (
+    SecurityService,
+    calibrate_password_hash_rounds,
+)
+
+PASSWORD = "Very$tr0ngPassw0rd"
+
+
+def test_passlib_hash_is_correct() -> None:
+    hashed_password = pbkdf2_sha256.using(rounds=1000).hash(PASSWORD)
+
+    assert SecurityService.is_password_correct(PASSWORD, hashed_password)
+    assert not SecurityService.is_password_correct("other", hashed_password)
+
+
+def test_hash_password_is_passlib_compatible(
+    security_service: SecurityService,
+) -> None:
+    hashed_password = security_service.hash_password(PASSWORD)
+
+    assert pbkdf2_sha256.verify(PASSWORD, hashed_password)
+    assert not pbkdf2_sha256.verify("other", hashed_password)
+
+
+@pytest.mark.parametrize(
+    "hashed_password",
+    (
+        "",
+        "plain",
+        "$pbkdf2-sha512$1000$c2FsdA$Y2hlY2tzdW0",
+        "$pbkdf2-sha256$1000$c2FsdA",
+        "$pbkdf2-sha256$1000$c2FsdA$Y2hlY2tzdW0$extra",
+        "$pbkdf2-sha256$many$c2FsdA$Y2hlY2tzdW0",
+        "$pbkdf2-sha256$0$c2FsdA$Y2hlY2tzdW0",
+        "$pbkdf2-sha256$1000$c2FsdA$Y2hlY2tzd",
+        "$pbkdf2-sha256$1000$c$Y2hlY2tzdW0",
+        "$pbkdf2-sha256$1000$c2FsdA$!!!!",
+    )
+)
+def test_malformed_hash_is_not_correct(hashed_password: str) -> None:
+    assert not SecurityService.is_password_correct(PASSWORD, hashed_password)
+
+
+@pytest.mark.parametrize("time_target", (0, -1))
+def test_calibrate_without_time_target_returns_min_rounds(
+    time_target: float,
+) -> None:
+    assert calibrate_password_hash_rounds(1000, time_target) == 1000
+
+
+def test_calibrate_is_not_below_min_rounds() -> None:
+    assert calibrate_password_hash_rounds(10**9, 0.001) == 10**9
+
+
+def test_calibrate_scales_with_time_target() -> None:
+    short = calibrate_password_hash_rounds(1, 0.01)
+    long = calibrate_password_hash_rounds(1, 1)
+
+    assert 1 < short < long
+
+
+@pytest.mark.parametrize(
+    "password,expected",
+    (
+        ("a" * 7, False),
+        ("a" * 8, True),
+    )
+)
+def test_password_length_is_checked(password: str, expected: bool) -> None:
+    security_service = SecurityService(
+        min_password_strength=0,
+        min_password_length=8,
+        password_hash_rounds=1,
+        password_salt_size=8,
+        registration_token_lifetime=timedelta(seconds=1),
+        change_email_token_lifetime=timedelta(seconds=1),
+        password_token_lifetime=timedelta(seconds=1),
+        access_token_lifetime=timedelta(seconds=1),
+        refresh_token_lifetime=timedelta(seconds=1),
+    )
+
+    assert security_service.is_password_proper(password) == expected